@@ -23,6 +23,12 @@ class WordleSolver {
     }
     
     async loadWords() {
+        if (await this.loadAssets()) {
+            document.getElementById('wordCount').textContent = `${this.allWords.length.toLocaleString()} words`;
+            this.updateDisplay();
+            return;
+        }
+        
         try {
             const answersRes = await fetch('https://gist.githubusercontent.com/cfreshman/a03ef2cba789d8cf00c08f767e0fad7b/raw/wordle-answers-alphabetical.txt');
             const answersText = await answersRes.text();
@@ -49,6 +55,55 @@ class WordleSolver {
         }
     }
     
+    async loadAssets() {
+        // Prebuilt by `python -m tools.build_assets`; hashed names never change content
+        try {
+            const manifestRes = await fetch('assets/manifest.json', { cache: 'no-cache' });
+            if (!manifestRes.ok) return false;
+            const manifest = await manifestRes.json();
+            
+            const wordsBuf = await this.fetchAsset(manifest.files.words);
+            const bookBuf = await this.fetchAsset(manifest.files.book);
+            const count = manifest.word_count;
+            
+            this.codes = new Uint32Array(wordsBuf, 0, count);
+            this.masks = new Uint32Array(wordsBuf, count * 4, count);
+            this.book = new Uint16Array(bookBuf);
+            
+            this.allWords = new Array(count);
+            this.wordIndex = new Map();
+            for (let i = 0; i < count; i++) {
+                let word = '';
+                for (let p = 0; p < 5; p++) {
+                    word += String.fromCharCode(97 + ((this.codes[i] >>> (5 * p)) & 31));
+                }
+                this.allWords[i] = word;
+                this.wordIndex.set(word, i);
+            }
+            
+            this.possibleWords = [...this.allWords];
+            this.lastValidSuggestions = [...this.allWords];
+            return true;
+        } catch (error) {
+            console.warn('Prebuilt assets unavailable, loading word lists:', error);
+            this.codes = this.masks = this.book = this.wordIndex = null;
+            return false;
+        }
+    }
+    
+    async fetchAsset(name) {
+        const url = `assets/${name}`;
+        const cache = 'caches' in window ? await caches.open('wordle-assets') : null;
+        
+        let res = cache ? await cache.match(url) : undefined;
+        if (!res) {
+            res = await fetch(url);
+            if (!res.ok) throw new Error(`Failed to load ${url}`);
+            if (cache) await cache.put(url, res.clone());
+        }
+        return res.arrayBuffer();
+    }
+    
     getExtraWords() {
         return [
             'soare', 'roate', 'raise', 'arise', 'irate', 'slate', 'crane', 'stare',
@@ -103,6 +158,15 @@ class WordleSolver {
             return this.possibleWords[0];
         }
         
+        if (this.book) {
+            const starter = this.allWords[this.book[0]];
+            if (this.attempts.length === 0) return starter;
+            if (this.attempts.length === 1 && this.attempts[0].word === starter) {
+                const next = this.book[1 + this.patternIndex(this.attempts[0].feedback)];
+                if (next !== 0xFFFF) return this.allWords[next];
+            }
+        }
+        
         if (this.attempts.length === 0) {
             const topStarters = ['soare', 'roate', 'raise', 'arise', 'irate'];
             for (const starter of topStarters) {
@@ -118,6 +182,15 @@ class WordleSolver {
         return scoredWords[0].word;
     }
     
+    patternIndex(feedback) {
+        // Base-3, position 0 lowest: B = 0, Y = 1, G = 2
+        let index = 0;
+        for (let i = 4; i >= 0; i--) {
+            index = index * 3 + (feedback[i] === 'G' ? 2 : feedback[i] === 'Y' ? 1 : 0);
+        }
+        return index;
+    }
+    
     setupEventListeners() {
         const wordInput = document.getElementById('wordInput');
         const feedbackInput = document.getElementById('feedbackInput');
@@ -282,6 +355,11 @@ class WordleSolver {
     }
     
     filterWords() {
+        if (this.masks) {
+            this.filterPacked();
+            return;
+        }
+        
         this.possibleWords = this.possibleWords.filter(word => {
             for (const [pos, letter] of Object.entries(this.constraints.green)) {
                 if (word[pos] !== letter) return false;
@@ -304,6 +382,38 @@ class WordleSolver {
         });
     }
     
+    filterPacked() {
+        const bit = letter => 1 << (letter.charCodeAt(0) - 97);
+        const code = letter => letter.charCodeAt(0) - 97;
+        
+        let yellowMask = 0;
+        let grayMask = 0;
+        for (const letter of this.constraints.yellow) yellowMask |= bit(letter);
+        for (const letter of this.constraints.gray) grayMask |= bit(letter);
+        
+        // [shift, letterCode] pairs for letters that must be / must not be at a position
+        const required = Object.entries(this.constraints.green).map(([pos, letter]) => [5 * pos, code(letter)]);
+        const forbidden = [];
+        for (const [letter, positions] of Object.entries(this.constraints.yellowNot)) {
+            for (const pos of positions) forbidden.push([5 * pos, code(letter)]);
+        }
+        
+        this.possibleWords = this.possibleWords.filter(word => {
+            const i = this.wordIndex.get(word);
+            const mask = this.masks[i];
+            if ((mask & grayMask) !== 0 || (mask & yellowMask) !== yellowMask) return false;
+            
+            const packed = this.codes[i];
+            for (const [shift, letter] of required) {
+                if (((packed >>> shift) & 31) !== letter) return false;
+            }
+            for (const [shift, letter] of forbidden) {
+                if (((packed >>> shift) & 31) === letter) return false;
+            }
+            return true;
+        });
+    }
+    
     updateDisplay() {
         const suggestion = this.getBestSuggestion();
         const suggestionEl = document.getElementById('suggestion');
@@ -3,7 +3,11 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 from solver.word_bank import WordBank
-from solver.solver_engine import WordleSolver
+from solver.solver_engine import (
+    WordleSolver, parse_game, pattern_digits, pattern_from_string,
+    CORRECT, PRESENT, SOLVED_PATTERN, pattern_to_string
+)
+from solver.session import SessionStore, make_snapshot, apply_snapshot
 
 
 class WordleSolverGUI:
@@ -37,9 +41,37 @@ class WordleSolverGUI:
         self.solver = WordleSolver(self.word_bank)
         self.attempts = []
         
+        self.session = SessionStore()
+        self.restore_session()
+        
         self.create_ui()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+        
+        if self.attempts:
+            self.undo_btn.config(state='normal')
+            self.display_history()
         print("✅ Ready!")
     
+    def restore_session(self):
+        """Resume the last game, if one was saved"""
+        snapshot = self.session.load()
+        if not snapshot:
+            return
+        
+        attempts = apply_snapshot(self.solver, snapshot)
+        if attempts:
+            self.attempts = attempts
+            print(f"↻ Resumed game with {len(attempts)} attempts")
+    
+    def save_session(self):
+        """Save the current game in the background"""
+        self.session.save(make_snapshot(self.solver, self.attempts))
+    
+    def on_close(self):
+        """Write the latest session before exiting"""
+        self.session.flush()
+        self.root.destroy()
+    
     def create_ui(self):
         """Create scrollable UI"""
         
@@ -150,6 +182,11 @@ class WordleSolverGUI:
         # Bind Tab and Enter
         self.word_entry.bind('<Return>', self.on_word_enter)
         self.word_entry.bind('<Tab>', self.on_word_tab)
+        self.word_entry.bind('<KeyRelease>', self.on_word_key)
+        
+        # Live completions
+        self.completions_frame = tk.Frame(input_card, bg=self.colors['white'])
+        self.completions_frame.pack(fill='x', padx=30)
         
         # Keyboard hints
         hints_frame = tk.Frame(input_card, bg=self.colors['white'])
@@ -175,7 +212,7 @@ class WordleSolverGUI:
         
         tk.Label(
             hints_frame,
-            text="= use suggestion  •  ",
+            text="= use completion / suggestion  •  ",
             font=('Segoe UI', 10),
             bg=self.colors['white'],
             fg=self.colors['text_lighter']
@@ -443,6 +480,51 @@ class WordleSolverGUI:
             
             self.stat_labels[key] = val_label
         
+        # What-If Card
+        whatif_card = tk.Frame(right, bg=self.colors['white'])
+        whatif_card.pack(fill='x', pady=(0, 20))
+        
+        tk.Label(
+            whatif_card,
+            text="What If",
+            font=('Segoe UI', 18, 'bold'),
+            bg=self.colors['white'],
+            fg=self.colors['text']
+        ).pack(anchor='w', padx=30, pady=(25, 5))
+        
+        tk.Label(
+            whatif_card,
+            text="How your typed guess splits the possible words. Add more words to compare",
+            font=('Segoe UI', 11),
+            bg=self.colors['white'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w', padx=30, pady=(0, 15))
+        
+        self.compare_entry = tk.Entry(
+            whatif_card,
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            relief='flat',
+            bd=0,
+            insertbackground=self.colors['primary']
+        )
+        self.compare_entry.pack(fill='x', padx=30, ipady=8, ipadx=10)
+        self.compare_entry.bind('<KeyRelease>', lambda e: self.update_whatif())
+        
+        self.whatif_text = tk.Text(
+            whatif_card,
+            font=('Consolas', 11),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            relief='flat',
+            bd=0,
+            padx=15,
+            pady=15,
+            height=12
+        )
+        self.whatif_text.pack(fill='x', padx=30, pady=(10, 25))
+        
         # Words Card
         words_card = tk.Frame(right, bg=self.colors['white'])
         words_card.pack(fill='both', expand=True)
@@ -505,6 +587,23 @@ class WordleSolverGUI:
         )
         reset_btn.pack(side='left', padx=5, pady=5, ipadx=20, ipady=10)
         
+        import_btn = tk.Button(
+            bottom_frame,
+            text="⇩  Import Game",
+            font=('Segoe UI', 13, 'bold'),
+            bg=self.colors['white'],
+            fg=self.colors['text'],
+            activebackground=self.colors['input_bg'],
+            command=self.open_import,
+            cursor='hand2',
+            relief='flat',
+            bd=1,
+            borderwidth=1,
+            highlightbackground=self.colors['border'],
+            highlightthickness=1
+        )
+        import_btn.pack(side='left', padx=5, pady=5, ipadx=20, ipady=10)
+        
         self.update_display()
     
     def on_word_enter(self, event):
@@ -513,13 +612,55 @@ class WordleSolverGUI:
         return 'break'
     
     def on_word_tab(self, event):
-        """Tab pressed in word field - use suggestion and move to feedback"""
-        suggestion = self.suggestion_label.cget('text')
+        """Tab pressed in word field - use top completion (or suggestion) and move to feedback"""
+        prefix = self.word_entry.get().strip()
+        completions = self.solver.get_completions(prefix, limit=1) if prefix else []
+        word = completions[0].upper() if completions else self.suggestion_label.cget('text')
+        
         self.word_entry.delete(0, tk.END)
-        self.word_entry.insert(0, suggestion)
+        self.word_entry.insert(0, word)
+        self.show_completions([])
         self.feedback_entry.focus()
         return 'break'  # Prevent default tab behavior
     
+    def on_word_key(self, event):
+        """Refresh completions as the word is typed"""
+        if event.keysym in ('Tab', 'Return'):
+            return
+        
+        prefix = self.word_entry.get().strip()
+        if 0 < len(prefix) < 5:
+            self.show_completions(self.solver.get_completions(prefix))
+        else:
+            self.show_completions([])
+        self.update_whatif()
+    
+    def show_completions(self, words):
+        """Show completion chips under the word field"""
+        for child in self.completions_frame.winfo_children():
+            child.destroy()
+        
+        for word in words:
+            chip = tk.Label(
+                self.completions_frame,
+                text=word.upper(),
+                font=('Segoe UI', 12, 'bold'),
+                bg='#EEF2FF',
+                fg=self.colors['primary'],
+                padx=10,
+                pady=4,
+                cursor='hand2'
+            )
+            chip.pack(side='left', padx=(0, 8), pady=(8, 0))
+            chip.bind('<Button-1>', lambda e, w=word: self.use_completion(w))
+    
+    def use_completion(self, word):
+        """Completion clicked - fill word field"""
+        self.word_entry.delete(0, tk.END)
+        self.word_entry.insert(0, word.upper())
+        self.show_completions([])
+        self.feedback_entry.focus()
+    
     def _on_mousewheel(self, event):
         """Handle mousewheel"""
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -545,33 +686,22 @@ class WordleSolverGUI:
             messagebox.showerror("Invalid Feedback", "Feedback must be 5 characters (G/Y/B)")
             return
         
-        feedback = []
-        for i, char in enumerate(feedback_str):
-            if char == 'G':
-                status = 'correct'
-            elif char == 'Y':
-                status = 'present'
-            elif char == 'B':
-                status = 'absent'
-            else:
-                messagebox.showerror("Invalid Character", f"Use only G, Y, or B (not '{char}')")
-                return
-            
-            feedback.append({
-                'letter': word[i].lower(),
-                'status': status,
-                'position': i
-            })
+        try:
+            pattern = pattern_from_string(feedback_str)
+        except ValueError as e:
+            messagebox.showerror("Invalid Character", str(e))
+            return
         
-        if all(fb['status'] == 'correct' for fb in feedback):
+        if pattern == SOLVED_PATTERN:
             messagebox.showinfo("🎉 Solved!", f"Puzzle solved in {len(self.attempts) + 1} attempts!\n\nThe word was: {word}")
             return
         
-        self.solver.process_feedback(word.lower(), feedback)
-        self.attempts.append((word, feedback_str))
+        self.solver.process_feedback(word.lower(), pattern)
+        self.attempts.append((word, pattern))
         
         self.word_entry.delete(0, tk.END)
         self.feedback_entry.delete(0, tk.END)
+        self.show_completions([])
         self.word_entry.focus()
         
         self.undo_btn.config(state='normal')
@@ -589,24 +719,7 @@ class WordleSolverGUI:
         
         self.attempts.pop()
         self.solver.reset()
-        
-        for word, feedback_str in self.attempts:
-            feedback = []
-            for i, char in enumerate(feedback_str):
-                if char == 'G':
-                    status = 'correct'
-                elif char == 'Y':
-                    status = 'present'
-                else:
-                    status = 'absent'
-                
-                feedback.append({
-                    'letter': word[i].lower(),
-                    'status': status,
-                    'position': i
-                })
-            
-            self.solver.process_feedback(word.lower(), feedback)
+        self.solver.process_batch([(word.lower(), pattern) for word, pattern in self.attempts])
         
         if len(self.attempts) == 0:
             self.undo_btn.config(state='disabled')
@@ -614,6 +727,86 @@ class WordleSolverGUI:
         self.display_history()
         self.update_display()
     
+    def open_import(self):
+        """Open dialog to paste a game in progress"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Import Game")
+        dialog.configure(bg=self.colors['white'])
+        dialog.transient(self.root)
+        
+        tk.Label(
+            dialog,
+            text="Paste Your Game",
+            font=('Segoe UI', 18, 'bold'),
+            bg=self.colors['white'],
+            fg=self.colors['text']
+        ).pack(anchor='w', padx=30, pady=(25, 5))
+        
+        tk.Label(
+            dialog,
+            text="One \"WORD GYBBB\" per line, or the emoji grid followed by your words",
+            font=('Segoe UI', 11),
+            bg=self.colors['white'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w', padx=30, pady=(0, 15))
+        
+        text = tk.Text(
+            dialog,
+            font=('Consolas', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            relief='flat',
+            bd=0,
+            padx=15,
+            pady=15,
+            width=40,
+            height=8
+        )
+        text.pack(fill='both', expand=True, padx=30)
+        text.focus()
+        
+        def submit():
+            if self.import_game(text.get('1.0', 'end')):
+                dialog.destroy()
+        
+        tk.Button(
+            dialog,
+            text="✓ Import",
+            font=('Segoe UI', 13, 'bold'),
+            bg=self.colors['primary'],
+            fg='white',
+            activebackground=self.colors['primary_hover'],
+            activeforeground='white',
+            command=submit,
+            cursor='hand2',
+            relief='flat',
+            bd=0
+        ).pack(fill='x', padx=30, pady=(15, 25), ipady=10)
+    
+    def import_game(self, text: str) -> bool:
+        """Apply a pasted game in one pass, return True on success"""
+        try:
+            pairs = parse_game(text)
+        except ValueError as e:
+            messagebox.showerror("Invalid Game", str(e))
+            return False
+        
+        for word, _ in pairs:
+            if not self.word_bank.is_valid(word):
+                messagebox.showerror("Invalid Word", f"'{word}' is not in our dictionary")
+                return False
+        
+        self.solver.process_batch([(word.lower(), pattern) for word, pattern in pairs])
+        self.attempts.extend(pairs)
+        
+        self.undo_btn.config(state='normal')
+        self.display_history()
+        self.update_display()
+        
+        if len(self.solver.possible_words) == 0:
+            messagebox.showwarning("No Matches", "No words match your feedback.\n\nPlease check your input.")
+        return True
+    
     def display_history(self):
         """Display history"""
         self.history_text.delete('1.0', 'end')
@@ -625,14 +818,13 @@ class WordleSolverGUI:
         
         self.attempt_count_label.config(text=f"{len(self.attempts)} attempt{'s' if len(self.attempts) > 1 else ''}")
         
-        for i, (word, feedback_str) in enumerate(self.attempts):
+        for i, (word, pattern) in enumerate(self.attempts):
             self.history_text.insert('end', f"  {i+1}.  ", 'number')
             
-            for j, letter in enumerate(word):
-                char = feedback_str[j]
-                if char == 'G':
+            for letter, status in zip(word, pattern_digits(pattern)):
+                if status == CORRECT:
                     self.history_text.insert('end', f"{letter} ", 'green')
-                elif char == 'Y':
+                elif status == PRESENT:
                     self.history_text.insert('end', f"{letter} ", 'yellow')
                 else:
                     self.history_text.insert('end', f"{letter} ", 'gray')
@@ -677,6 +869,39 @@ class WordleSolverGUI:
             for i in range(0, 150, 5):
                 line = '  '.join([w.upper().ljust(6) for w in words[i:i+5]])
                 self.words_text.insert('end', line + '\n')
+        
+        self.update_whatif()
+        self.save_session()
+    
+    def update_whatif(self):
+        """Compare partitions of the typed guess and any extra words"""
+        words = [self.word_entry.get().strip()] + self.compare_entry.get().replace(',', ' ').split()
+        words = [w.lower() for w in words if len(w) == 5 and self.word_bank.is_valid(w)]
+        words = list(dict.fromkeys(words))[:4]
+        
+        self.whatif_text.delete('1.0', 'end')
+        if not words:
+            self.whatif_text.insert('end', "Type a word to see how it would split the possible words")
+            return
+        
+        summaries = self.solver.compare_guesses(words, top=2, sample=6)
+        
+        rows = [
+            ('', lambda r: r['guess'].upper()),
+            ('Patterns', lambda r: f"{r['buckets']:,}"),
+            ('Expected left', lambda r: f"{r['expected']:,.1f}"),
+            ('Worst case', lambda r: f"{r['worst']:,}"),
+            ('Bits', lambda r: f"{r['entropy']:.2f}")
+        ]
+        for label, cell in rows:
+            line = label.ljust(14) + ''.join(cell(r).rjust(10) for r in summaries)
+            self.whatif_text.insert('end', line + '\n')
+        
+        for r in summaries:
+            self.whatif_text.insert('end', f"\n{r['guess'].upper()} biggest groups\n")
+            for pattern, size, sample in r['largest']:
+                more = '…' if size > len(sample) else ''
+                self.whatif_text.insert('end', f"  {pattern_to_string(pattern)} ({size:,}): {' '.join(sample).upper()}{more}\n")
     
     def reset(self):
         """Reset game"""
@@ -688,6 +913,7 @@ class WordleSolverGUI:
         self.attempts = []
         self.word_entry.delete(0, tk.END)
         self.feedback_entry.delete(0, tk.END)
+        self.show_completions([])
         self.history_text.delete('1.0', 'end')
         self.undo_btn.config(state='disabled')
         self.update_display()
@@ -0,0 +1,49 @@
+"""Parallel Scoring - Thread or process pools for guess ranking"""
+
+import os
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+# Free-threaded CPython (3.13t+) runs threads on all cores
+GIL_DISABLED = hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled()
+
+_executors: Dict[Tuple[str, int], Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def default_backend() -> str:
+    """'thread' on free-threaded builds, 'process' otherwise"""
+    return 'thread' if GIL_DISABLED else 'process'
+
+
+def cpu_count() -> int:
+    return os.cpu_count() or 1
+
+
+def get_executor(backend: str, workers: int) -> Executor:
+    """Shared pool per (backend, workers), created on first use"""
+    key = (backend, workers)
+    with _executors_lock:
+        if key not in _executors:
+            pool_class = ThreadPoolExecutor if backend == 'thread' else ProcessPoolExecutor
+            _executors[key] = pool_class(max_workers=workers)
+        return _executors[key]
+
+
+def split(items: List, parts: int) -> List[List]:
+    """Split items into at most parts contiguous chunks"""
+    size = -(-len(items) // parts)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def score_histograms(guesses: List[str], remaining) -> List[Tuple[str, Counter]]:
+    """Pattern histograms for a chunk of guesses (process pool worker)"""
+    from solver.solver_engine import get_feedback_pattern  # solver_engine imports this module
+
+    return [
+        (guess, Counter(get_feedback_pattern(guess, answer) for answer in remaining))
+        for guess in guesses
+    ]
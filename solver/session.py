@@ -0,0 +1,150 @@
+"""Session Snapshots - Save and restore a game in progress"""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from solver.solver_engine import SOLVED_PATTERN
+
+SESSION_VERSION = 1
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.wordle_solver', 'session.json.gz')
+
+# Only the top of a full ranking is worth keeping
+MAX_SAVED_RANKING = 100
+
+
+_word_list_ids = {}
+
+
+def word_list_id(vocabulary) -> str:
+    """Fingerprint of the sorted word list a snapshot was taken against (cached)"""
+    key = id(vocabulary)
+    cached = _word_list_ids.get(key)
+    if cached is None or cached[0] is not vocabulary:
+        digest = hashlib.sha256(' '.join(vocabulary).encode()).hexdigest()[:16]
+        cached = _word_list_ids[key] = (vocabulary, digest)
+    return cached[1]
+
+
+def pack_words(words, vocabulary: Sequence[str]) -> str:
+    """Encode a subset of the sorted vocabulary as a base64 bitmap"""
+    bits = bytearray((len(vocabulary) + 7) // 8)
+    for i, word in enumerate(vocabulary):
+        if word in words:
+            bits[i // 8] |= 1 << (i % 8)
+    return base64.b64encode(bits).decode()
+
+
+def unpack_words(packed: str, vocabulary: Sequence[str]) -> List[str]:
+    """Decode a bitmap from pack_words"""
+    bits = base64.b64decode(packed)
+    return [word for i, word in enumerate(vocabulary) if bits[i // 8] >> (i % 8) & 1]
+
+
+def _check_attempt(word, pattern) -> Tuple[str, int]:
+    """Raise ValueError unless word is a 5-letter word and pattern a valid feedback pattern"""
+    if not (isinstance(word, str) and len(word) == 5 and word.isascii() and word.isalpha()):
+        raise ValueError(f"bad word {word!r}")
+    if type(pattern) is not int or not 0 <= pattern <= SOLVED_PATTERN:
+        raise ValueError(f"bad pattern {pattern!r}")
+    return word, pattern
+
+
+def make_snapshot(solver, attempts: List[Tuple[str, int]]) -> Dict:
+    """Capture attempts, remaining words and cached suggestions"""
+    vocabulary = solver.word_bank.sorted_words
+    ranking = solver.cache['ranking']
+
+    return {
+        'version': SESSION_VERSION,
+        'words': word_list_id(vocabulary),
+        'attempts': [list(a) for a in attempts],
+        'remaining': pack_words(solver.possible_words, vocabulary),
+        'best': solver.cache['best'],
+        'ranking': ranking[:MAX_SAVED_RANKING] if ranking else None
+    }
+
+
+def apply_snapshot(solver, snapshot: Dict) -> Optional[List[Tuple[str, int]]]:
+    """Restore solver state, return the attempts (None if snapshot doesn't fit)"""
+    if not isinstance(snapshot, dict):
+        return None
+
+    vocabulary = solver.word_bank.sorted_words
+    if snapshot.get('version') != SESSION_VERSION or snapshot.get('words') != word_list_id(vocabulary):
+        return None
+
+    try:
+        attempts = [_check_attempt(word, pattern) for word, pattern in snapshot['attempts']]
+        guesses = [(word.lower(), pattern) for word, pattern in attempts]
+        remaining = unpack_words(snapshot['remaining'], vocabulary)
+        best = tuple(snapshot['best']) if snapshot['best'] else None
+        ranking = [tuple(r) for r in snapshot['ranking']] if snapshot['ranking'] else None
+        if best and best[0] is not None and not isinstance(best[0], str):
+            raise ValueError(f"bad suggestion {best!r}")
+        if ranking and not all(isinstance(word, str) for word, _ in ranking):
+            raise ValueError("bad ranking")
+    except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+        return None
+
+    solver.restore(guesses, remaining, {'best': best, 'ranking': ranking})
+    return attempts
+
+
+class SessionStore:
+    """Writes snapshots in the background, keeping only the latest pending one"""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._pending = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def load(self) -> Optional[Dict]:
+        """Read the saved snapshot, None if missing or unreadable"""
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, EOFError, ValueError):
+            return None
+
+    def save(self, snapshot: Dict):
+        """Queue snapshot for writing"""
+        with self._lock:
+            self._pending = snapshot
+        self._wake.set()
+
+    def flush(self):
+        """Write any pending snapshot now"""
+        with self._write_lock:
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+            if snapshot is not None:
+                self._write(snapshot)
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self.flush()
+
+    def _write(self, snapshot: Dict):
+        """Atomic write so a crash never leaves a half-written file"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + '.tmp'
+            data = gzip.compress(json.dumps(snapshot, separators=(',', ':')).encode('utf-8'))
+            with open(tmp, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠ Could not save session: {e}")
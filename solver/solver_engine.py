@@ -1,13 +1,183 @@
 """Wordle Solver Engine"""
 
-from typing import List, Dict, Set
-from collections import defaultdict
+from typing import List, Dict, Set, Tuple
+from collections import defaultdict, Counter
+import functools
+import heapq
+import math
+import os
 import random
+import threading
+
+from solver import parallel
+
+# Rank the whole vocabulary by entropy once the remaining set is this small
+FULL_RANKING_LIMIT = 20
+
+# Only spread a ranking over workers when it needs this many pattern computations
+PARALLEL_MIN_PATTERNS = 200_000
+
+DEFAULT_STARTERS = ['soare', 'roate', 'raise', 'slate', 'crane', 'stare']
+STARTERS_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'starters.tsv'
+)
+
+# Feedback is a base-3 integer: digit i (weight 3**i) is position i
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+SOLVED_PATTERN = 242
+
+PATTERN_CHARS = 'BYG'
+PATTERN_EMOJI = '⬛🟨🟩'
+STATUS_NAMES = ('absent', 'present', 'correct')
+EMOJI_CODES = {
+    '🟩': 'G', '🟧': 'G',
+    '🟨': 'Y', '🟦': 'Y',
+    '⬛': 'B', '⬜': 'B'
+}
+
+
+def get_feedback_pattern(guess: str, answer: str) -> int:
+    """Feedback Wordle would show for guess against answer"""
+    if guess == answer:
+        return SOLVED_PATTERN
+    
+    digits = [0] * 5
+    unmatched = []
+    
+    for i in range(5):
+        if guess[i] == answer[i]:
+            digits[i] = CORRECT
+        else:
+            unmatched.append(answer[i])
+    
+    for i in range(5):
+        if digits[i] == ABSENT and guess[i] in unmatched:
+            digits[i] = PRESENT
+            unmatched.remove(guess[i])
+    
+    return digits[0] + 3 * digits[1] + 9 * digits[2] + 27 * digits[3] + 81 * digits[4]
+
+
+def pattern_digits(pattern: int) -> List[int]:
+    """Per-position status codes of a pattern"""
+    return [pattern // 3 ** i % 3 for i in range(5)]
+
+
+def pattern_from_string(feedback_str: str) -> int:
+    """'GYBBB' -> pattern"""
+    feedback_str = feedback_str.strip().upper()
+    if len(feedback_str) != 5:
+        raise ValueError("Feedback must be 5 characters (G/Y/B)")
+    
+    pattern = 0
+    for i, char in enumerate(feedback_str):
+        if char not in PATTERN_CHARS:
+            raise ValueError(f"Use only G, Y, or B (not '{char}')")
+        pattern += PATTERN_CHARS.index(char) * 3 ** i
+    return pattern
+
+
+def pattern_to_string(pattern: int) -> str:
+    """Pattern -> 'GYBBB'"""
+    return ''.join(PATTERN_CHARS[d] for d in pattern_digits(pattern))
+
+
+def pattern_from_emoji(emoji: str) -> int:
+    """'🟩🟨⬛⬛⬛' -> pattern (high-contrast colours accepted)"""
+    emoji = emoji.replace('\ufe0f', '')
+    if len(emoji) != 5 or any(c not in EMOJI_CODES for c in emoji):
+        raise ValueError(f"Not a feedback row: '{emoji}'")
+    return pattern_from_string(''.join(EMOJI_CODES[c] for c in emoji))
+
+
+def pattern_to_emoji(pattern: int) -> str:
+    """Pattern -> '🟩🟨⬛⬛⬛'"""
+    return ''.join(PATTERN_EMOJI[d] for d in pattern_digits(pattern))
+
+
+def pattern_from_feedback(feedback: List[Dict]) -> int:
+    """Legacy [{'letter', 'status', 'position'}, ...] feedback -> pattern"""
+    return sum(STATUS_NAMES.index(fb['status']) * 3 ** fb['position'] for fb in feedback)
+
+
+def feedback_from_pattern(guess: str, pattern: int) -> List[Dict]:
+    """Pattern -> legacy feedback dicts"""
+    return [
+        {'letter': guess[i], 'status': STATUS_NAMES[d], 'position': i}
+        for i, d in enumerate(pattern_digits(pattern))
+    ]
+
+
+def load_starters(path: str = STARTERS_FILE) -> List[str]:
+    """Ranked opening words from a starter sweep, or the defaults"""
+    try:
+        with open(path, 'r') as f:
+            starters = [line.split('\t')[0] for line in f if line.strip() and not line.startswith('#')]
+    except OSError:
+        return list(DEFAULT_STARTERS)
+    return starters or list(DEFAULT_STARTERS)
+
+
+def _as_pattern(token: str):
+    """Pattern for a G/Y/B or emoji token, or None if it isn't one"""
+    for parse in (pattern_from_emoji, pattern_from_string):
+        try:
+            return parse(token)
+        except ValueError:
+            pass
+    return None
+
+
+def parse_game(text: str) -> List[Tuple[str, int]]:
+    """
+    Parse a pasted game into (WORD, pattern) pairs
+    Accepts 'WORD GYBBB' / 'WORD 🟩🟨⬛⬛⬛' lines, or an emoji grid
+    with the guessed words on their own lines (matched in order)
+    """
+    pairs = []
+    words, patterns = [], []
+    
+    for line in text.splitlines():
+        tokens = line.split()
+        if len(tokens) == 2 and tokens[0].isalpha() and len(tokens[0]) == 5 and _as_pattern(tokens[1]) is not None:
+            pairs.append((tokens[0].upper(), _as_pattern(tokens[1])))
+        elif len(tokens) == 1 and not tokens[0].isalpha() and _as_pattern(tokens[0]) is not None:
+            patterns.append(_as_pattern(tokens[0]))
+        elif len(tokens) == 1 and tokens[0].isalpha() and len(tokens[0]) == 5:
+            words.append(tokens[0].upper())
+    
+    if len(words) != len(patterns):
+        raise ValueError(f"Found {len(words)} words but {len(patterns)} feedback rows")
+    
+    pairs.extend(zip(words, patterns))
+    if not pairs:
+        raise ValueError("No guesses found")
+    return pairs
+
+
+def synchronized(method):
+    """Run method holding the solver's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class WordleSolver:
-    def __init__(self, word_bank):
+    """
+    Solver session. The word bank is shared and read-only; session state is
+    guarded by a lock so one solver can be used from several threads.
+    workers > 1 spreads large rankings over a thread pool on free-threaded
+    builds and a process pool otherwise (backend overrides the choice).
+    """
+    
+    def __init__(self, word_bank, workers: int = 1, backend: str = None):
         self.word_bank = word_bank
+        self.workers = workers
+        self.backend = backend or parallel.default_backend()
+        self._lock = threading.RLock()
+        self.starters = load_starters()
         self.possible_words = set(word_bank.all_words)
         self.constraints = {
             'green': {},
@@ -15,7 +185,12 @@ class WordleSolver:
             'gray': set(),
             'yellow_not': defaultdict(set)
         }
+        self.cache = {'best': None, 'ranking': None}
+        self.summaries = {}
+        self.histograms = {}
+        self.last_pruned = 0
     
+    @synchronized
     def reset(self):
         """Reset solver"""
         self.possible_words = set(self.word_bank.all_words)
@@ -25,33 +200,69 @@ class WordleSolver:
             'gray': set(),
             'yellow_not': defaultdict(set)
         }
+        # histograms stay: each remembers the set it counted, so a later
+        # ranking (undo, a resumed or replayed game) adjusts rather than recounts
+        self.clear_cache()
     
-    def process_feedback(self, guess: str, feedback: List[Dict]):
+    @synchronized
+    def clear_cache(self):
+        """Forget computed suggestions and partition summaries"""
+        self.cache = {'best': None, 'ranking': None}
+        self.summaries = {}
+    
+    @synchronized
+    def restore(self, guesses: List[Tuple[str, int]], possible_words, cache=None):
+        """Restore a saved session without refiltering"""
+        self.reset()
+        for guess, pattern in guesses:
+            self._merge_feedback(guess, pattern)
+        
+        self.possible_words = set(possible_words)
+        if cache:
+            self.cache.update(cache)
+    
+    @synchronized
+    def process_feedback(self, guess: str, feedback: int):
         """
-        Process Wordle feedback
-        feedback = [
-            {'letter': 'a', 'status': 'correct/present/absent', 'position': 0},
-            ...
-        ]
+        Process Wordle feedback for guess
+        feedback is a pattern (see pattern_from_string); the legacy list of
+        {'letter', 'status', 'position'} dicts is still accepted
         """
+        if not isinstance(feedback, int):
+            feedback = pattern_from_feedback(feedback)
+        
+        self._merge_feedback(guess, feedback)
+        self.filter_possible_words()
+    
+    @synchronized
+    def process_batch(self, guesses: List[Tuple[str, int]]):
+        """Merge several (guess, pattern) observations, then filter once"""
+        for guess, pattern in guesses:
+            self._merge_feedback(guess, pattern)
+        
+        self.filter_possible_words()
+    
+    def _merge_feedback(self, guess: str, pattern: int):
+        """Add one guess's feedback to the constraints"""
         guess = guess.lower()
+        digits = pattern_digits(pattern)
         
-        for fb in feedback:
-            letter = fb['letter'].lower()
-            status = fb['status']
-            position = fb['position']
-            
-            if status == 'correct':
+        # A repeated letter can be gray in one spot and green/yellow in another
+        found = {guess[i] for i in range(5) if digits[i] != ABSENT}
+        
+        for position, (letter, status) in enumerate(zip(guess, digits)):
+            if status == CORRECT:
                 self.constraints['green'][position] = letter
-            elif status == 'present':
+            elif status == PRESENT:
                 self.constraints['yellow'].add(letter)
                 self.constraints['yellow_not'][letter].add(position)
-            elif status == 'absent':
-                if letter not in self.constraints['yellow']:
+            else:
+                if letter in self.constraints['yellow']:
+                    self.constraints['yellow_not'][letter].add(position)
+                elif letter not in found and letter not in self.constraints['green'].values():
                     self.constraints['gray'].add(letter)
-        
-        self.filter_possible_words()
     
+    @synchronized
     def filter_possible_words(self):
         """Filter words matching constraints"""
         filtered = set()
@@ -61,6 +272,7 @@ class WordleSolver:
                 filtered.add(word)
         
         self.possible_words = filtered
+        self.clear_cache()
     
     def matches_constraints(self, word: str) -> bool:
         """Check if word matches all constraints"""
@@ -86,8 +298,15 @@ class WordleSolver:
         
         return True
     
+    @synchronized
     def get_best_guess(self):
-        """Get best next guess"""
+        """Get best next guess (cached until the remaining words change)"""
+        if self.cache['best'] is None:
+            self.cache['best'] = self._compute_best_guess()
+        return self.cache['best']
+    
+    def _compute_best_guess(self):
+        """Pick best next guess"""
         if not self.possible_words:
             return None, 0
         
@@ -95,22 +314,178 @@ class WordleSolver:
             return list(self.possible_words)[0], 1
         
         # First guess - use optimal starters
-        best_starters = ['soare', 'roate', 'raise', 'slate', 'crane', 'stare']
-        if len(self.constraints['green']) == 0 and len(self.constraints['yellow']) == 0:
-            for starter in best_starters:
+        if not any(self.constraints[kind] for kind in ('green', 'yellow', 'gray')):
+            for starter in self.starters:
                 if starter in self.word_bank.all_words:
                     return starter, len(self.possible_words)
         
-        # Pick from possible words
-        words_list = list(self.possible_words)
-        if len(words_list) > 20:
-            sample = random.sample(words_list, 20)
-            best = max(sample, key=self.word_bank.get_word_score)
-        else:
-            best = max(words_list, key=self.word_bank.get_word_score)
+        # Few candidates left - pick the most informative guess
+        if len(self.possible_words) <= FULL_RANKING_LIMIT:
+            if self.cache['ranking'] is None:
+                self.cache['ranking'] = self.rank_guesses()
+            best, _ = self.cache['ranking'][0]
+            return best, len(self.possible_words)
+        
+        # Pick from a sample of possible words (sorted first: set order varies
+        # with how the set was built, and the same seed should give the same pick)
+        sample = random.sample(sorted(self.possible_words), 20)
+        best = max(sample, key=self.word_bank.get_word_score)
         
         return best, len(self.possible_words)
     
+    def prune_guesses(self, guesses) -> Tuple[List[str], int]:
+        """
+        Drop guesses that can't beat another guess in the pool
+        Letters absent from every remaining word always come back gray, so
+        guesses differing only in those letters split the remaining set the
+        same way; keep one per such signature (preferring possible answers)
+        and drop guesses that touch no remaining letter at all.
+        Returns (kept guesses, number skipped)
+        """
+        live = set(''.join(self.possible_words))
+        ordered = sorted(guesses, key=lambda w: (w not in self.possible_words, w))
+        
+        kept = []
+        seen = set()
+        for guess in ordered:
+            signature = ''.join(c if c in live else '.' for c in guess)
+            if signature == '.....' or signature in seen:
+                continue
+            seen.add(signature)
+            kept.append(guess)
+        
+        return kept, len(ordered) - len(kept)
+    
+    @synchronized
+    def get_partition_summary(self, guess: str, top: int = 3, sample: int = 8) -> Dict:
+        """
+        What guess would do to the remaining words:
+        bucket count, expected and worst-case remaining size, entropy,
+        and the top largest buckets as (pattern, size, first sample words).
+        Cached until the remaining words change.
+        Raises ValueError if guess isn't a 5-letter word from the word bank.
+        """
+        guess = guess.lower()
+        if len(guess) != 5:
+            raise ValueError(f"Guess must be 5 letters (not '{guess}')")
+        if not self.word_bank.is_valid(guess):
+            raise ValueError(f"'{guess}' is not in the word list")
+        key = (guess, top, sample)
+        if key in self.summaries:
+            return self.summaries[key]
+        
+        buckets = defaultdict(list)
+        for answer in self.possible_words:
+            buckets[get_feedback_pattern(guess, answer)].append(answer)
+        
+        total = len(self.possible_words)
+        sizes = sorted((len(words) for words in buckets.values()), reverse=True)
+        largest = sorted(buckets.items(), key=lambda b: (-len(b[1]), b[0]))[:top]
+        
+        self.summaries[key] = {
+            'guess': guess,
+            'buckets': len(buckets),
+            'expected': sum(n * n for n in sizes) / total if total else 0,
+            'worst': sizes[0] if sizes else 0,
+            'entropy': -sum(n / total * math.log2(n / total) for n in sizes) if total else 0,
+            'largest': [(pattern, len(words), sorted(words)[:sample]) for pattern, words in largest]
+        }
+        return self.summaries[key]
+    
+    @synchronized
+    def compare_guesses(self, guesses: List[str], **kwargs) -> List[Dict]:
+        """Partition summaries for several hypothetical guesses"""
+        return [self.get_partition_summary(guess, **kwargs) for guess in guesses]
+    
+    def _get_histogram(self, guess: str, remaining: frozenset, changes: Dict) -> Counter:
+        """
+        Partition of remaining for guess, reusing the histogram from an earlier
+        ranking: subtract the words eliminated since then and add back any
+        restored by an undo, or recount when that would touch more words.
+        changes caches counted-set -> (removed, added) across one ranking
+        """
+        entry = self.histograms.get(guess)
+        if entry is not None:
+            counted, histogram = entry
+            if counted is remaining:
+                return histogram
+            
+            if counted not in changes:
+                changes[counted] = (counted - remaining, remaining - counted)
+            removed, added = changes[counted]
+            
+            if len(removed) + len(added) < len(remaining):
+                for answer in removed:
+                    pattern = get_feedback_pattern(guess, answer)
+                    histogram[pattern] -= 1
+                    if not histogram[pattern]:
+                        del histogram[pattern]
+                for answer in added:
+                    histogram[get_feedback_pattern(guess, answer)] += 1
+                self.histograms[guess] = (remaining, histogram)
+                return histogram
+        
+        histogram = Counter(get_feedback_pattern(guess, answer) for answer in remaining)
+        self.histograms[guess] = (remaining, histogram)
+        return histogram
+    
+    def _parallel_histograms(self, pool: List[str], remaining: frozenset, changes: Dict):
+        """
+        Histograms for pool across the worker pool. Threads share and update
+        the incremental histograms directly; processes count from scratch.
+        """
+        executor = parallel.get_executor(self.backend, self.workers)
+        chunks = parallel.split(pool, self.workers * 4)
+        
+        if self.backend == 'thread':
+            count = lambda chunk: [(g, self._get_histogram(g, remaining, changes)) for g in chunk]
+            return [item for part in executor.map(count, chunks) for item in part]
+        
+        results = []
+        for part in executor.map(parallel.score_histograms, chunks, [remaining] * len(chunks)):
+            for guess, histogram in part:
+                self.histograms[guess] = (remaining, histogram)
+                results.append((guess, histogram))
+        return results
+    
+    @synchronized
+    def rank_guesses(self, guesses=None) -> List[Tuple[str, float]]:
+        """
+        Rank guesses (default: all words) by entropy of the feedback they
+        would produce on the remaining words, highest first.
+        Ties go to possible answers, then letter score.
+        """
+        if guesses is None:
+            guesses = self.word_bank.all_words
+        
+        pool, self.last_pruned = self.prune_guesses(guesses)
+        total = len(self.possible_words)
+        remaining = frozenset(self.possible_words)
+        changes = {}
+        
+        if self.workers > 1 and len(pool) * total >= PARALLEL_MIN_PATTERNS:
+            histograms = self._parallel_histograms(pool, remaining, changes)
+        else:
+            histograms = [(guess, self._get_histogram(guess, remaining, changes)) for guess in pool]
+        
+        ranked = []
+        for guess, partition in histograms:
+            # Sorted so the sum doesn't depend on how the histogram was built
+            entropy = -sum(n / total * math.log2(n / total) for n in sorted(partition.values()))
+            ranked.append((guess, entropy))
+        
+        ranked.sort(key=lambda r: (
+            -r[1], r[0] not in self.possible_words, -self.word_bank.get_word_score(r[0])
+        ))
+        return ranked
+    
+    @synchronized
+    def get_completions(self, prefix: str, limit: int = 5) -> List[str]:
+        """Best-scoring remaining words that start with prefix"""
+        matches = [w for w in self.word_bank.get_completions(prefix) if w in self.possible_words]
+        return heapq.nlargest(limit, matches, key=self.word_bank.get_word_score)
+    
+    @synchronized
     def get_possible_words(self) -> List[str]:
         """Get remaining possible words"""
         return sorted(list(self.possible_words))
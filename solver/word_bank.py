@@ -2,17 +2,23 @@
 
 import os
 import urllib.request
-from typing import Set
+from bisect import bisect_left
+from typing import FrozenSet, List, Set, Tuple
 from collections import Counter
+from types import MappingProxyType
 
 
 class WordBank:
+    """Word lists and letter frequencies, read-only once loaded so sessions can share them"""
+    
     def __init__(self):
-        self.all_words: Set[str] = set()
-        self.letter_freq = {}
+        self.all_words: FrozenSet[str] = frozenset()
+        self.answers: FrozenSet[str] = frozenset()
+        self.letter_freq = MappingProxyType({})
         
         self.load_words()
         self.calculate_frequencies()
+        self.sorted_words: Tuple[str, ...] = tuple(sorted(self.all_words))
     
     def load_words(self):
         """Load word lists"""
@@ -36,11 +42,13 @@ class WordBank:
             with open(guesses_file, 'r') as f:
                 guesses = {w.strip().lower() for w in f if len(w.strip()) == 5}
             
-            self.all_words = answers.union(guesses)
+            self.answers = frozenset(answers)
+            self.all_words = frozenset(answers.union(guesses))
             print(f"✅ Loaded {len(self.all_words):,} words")
         except:
             print("⚠ Using fallback word list")
-            self.all_words = self._get_fallback_words()
+            self.all_words = frozenset(self._get_fallback_words())
+            self.answers = self.all_words
     
     def _download_words(self, answers_file, guesses_file):
         """Download official Wordle word lists"""
@@ -89,7 +97,7 @@ class WordBank:
                 counter[letter] += 1
         
         total = len(self.all_words)
-        self.letter_freq = {letter: count/total for letter, count in counter.items()}
+        self.letter_freq = MappingProxyType({letter: count/total for letter, count in counter.items()})
     
     def is_valid(self, word: str) -> bool:
         """Check if word is valid"""
@@ -99,3 +107,10 @@ class WordBank:
         """Score word by letter frequency"""
         unique = set(word.lower())
         return sum(self.letter_freq.get(letter, 0) for letter in unique)
+    
+    def get_completions(self, prefix: str) -> List[str]:
+        """All words starting with prefix, alphabetically"""
+        prefix = prefix.lower()
+        start = bisect_left(self.sorted_words, prefix)
+        end = bisect_left(self.sorted_words, prefix + '{')  # '{' sorts right after 'z'
+        return list(self.sorted_words[start:end])
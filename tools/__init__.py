@@ -0,0 +1,12 @@
+"""Command-line tools built on the solver"""
+
+import contextlib
+import io
+
+from solver.word_bank import WordBank
+
+
+def quiet_word_bank() -> WordBank:
+    """WordBank without its load messages"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return WordBank()
@@ -0,0 +1,312 @@
+"""Micro-benchmarks for solver hot paths
+
+Usage: python -m tools.benchmark [--save] [--threshold 0.25] [--only NAME]
+       python -m tools.benchmark --scaling [--backend thread|process]
+
+Compares against the stored baseline and exits non-zero when any benchmark
+is slower than baseline * (1 + threshold) and stays slower when re-checked.
+Each benchmark is timed in short rounds alternating with a fixed
+calibration workload and reported relative to it, so a busier or throttled
+machine doesn't count as a regression.
+--scaling times a full guess ranking for each worker count instead
+(machine-specific, never stored).
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Tuple
+
+from solver import parallel
+from solver.word_bank import WordBank
+from solver.solver_engine import FULL_RANKING_LIMIT, WordleSolver, get_feedback_pattern
+from tools import quiet_word_bank
+
+BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'benchmarks', 'baseline.json'
+)
+SEED = 1234
+
+# Fixed pure-Python workload every benchmark is timed against; results are
+# compared relative to it so a busier or slower machine doesn't read as a regression
+CALIBRATION = '_calibration'
+
+# A slowdown only counts if it shows up again this many more times; a real
+# regression reproduces, a noisy round usually doesn't
+RECHECKS = 2
+
+# (answer, guesses) - feedback is derived, so the scripts are fully deterministic
+FEEDBACK_SCRIPTS: List[Tuple[str, List[str]]] = [
+    ('cigar', ['soare', 'crane']),
+    ('shake', ['soare', 'shale']),
+    ('pound', ['soare', 'bound']),
+]
+
+
+def solver_after(word_bank: WordBank, answer: str, guesses: List[str]) -> WordleSolver:
+    """Solver with the given guesses already applied"""
+    solver = WordleSolver(word_bank)
+    for guess in guesses:
+        solver.process_feedback(guess, get_feedback_pattern(guess, answer))
+    return solver
+
+
+def _loops_for(func: Callable, round_time: float, setup: Callable = None) -> int:
+    """Calls per round so one round takes at least round_time"""
+    loops = 1
+    while _time_round(func, loops, setup) * loops < round_time:
+        loops *= 2
+    return loops
+
+
+def _time_round(func: Callable, loops: int, setup: Callable = None) -> float:
+    """Seconds per call over one round of loops calls, setup (untimed) before each"""
+    if setup is None:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return (time.perf_counter() - start) / loops
+
+    elapsed = 0.0
+    for _ in range(loops):
+        setup()
+        start = time.perf_counter()
+        func()
+        elapsed += time.perf_counter() - start
+    return elapsed / loops
+
+
+def time_call(func: Callable, min_time: float = 1.0, round_time: float = 0.01) -> float:
+    """Best seconds per call over short rounds (at least 5, min_time in total)"""
+    loops = _loops_for(func, round_time)
+    rounds = []
+    deadline = time.perf_counter() + min_time
+    while len(rounds) < 5 or time.perf_counter() < deadline:
+        rounds.append(_time_round(func, loops))
+    return min(rounds)
+
+
+def time_relative(func: Callable, setup: Callable = None, min_time: float = 1.0,
+                  round_time: float = 0.01) -> float:
+    """
+    Median cost of func relative to calibration_workload, timed in
+    alternating short rounds so both see the same CPU throttling and load
+    """
+    loops = _loops_for(func, round_time, setup)
+    reference_loops = _loops_for(calibration_workload, round_time)
+    ratios = []
+    deadline = time.perf_counter() + min_time
+    while len(ratios) < 5 or time.perf_counter() < deadline:
+        ratios.append(_time_round(func, loops, setup) / _time_round(calibration_workload, reference_loops))
+    return statistics.median(ratios)
+
+
+def calibration_workload():
+    """Dict, string and arithmetic work similar in kind to the solver's"""
+    counts = {}
+    for i in range(2000):
+        key = chr(97 + i % 26) * (i % 5 + 1)
+        counts[key] = counts.get(key, 0) + i * 3 % 7
+    return counts
+
+
+def forget_suggestions(solver: WordleSolver, kept: Dict = None):
+    """
+    Untimed setup for get_best_guess: drop cached work and reseed sampling.
+    Histograms start empty, or as copies of kept ones from earlier rankings.
+    """
+    random.seed(SEED)
+    solver.clear_cache()
+    solver.histograms = {guess: (counted, Counter(h)) for guess, (counted, h) in (kept or {}).items()}
+
+
+def after_undo(word_bank: WordBank, answer: str, guesses: List[str]) -> Tuple[WordleSolver, Dict]:
+    """
+    Solver back at guesses after playing its own next guess and undoing it
+    the way the GUI does, plus the histograms those rankings left behind
+    """
+    solver = solver_after(word_bank, answer, guesses)
+    for _ in range(2):
+        random.seed(SEED)
+        guess, _ = solver.get_best_guess()
+        if guess == answer:
+            break
+        solver.process_feedback(guess, get_feedback_pattern(guess, answer))
+
+    kept = dict(solver.histograms)
+    solver.reset()
+    solver.process_batch([(guess, get_feedback_pattern(guess, answer)) for guess in guesses])
+    return solver, kept
+
+
+def collect_benchmarks(word_bank: WordBank) -> Tuple[Dict[str, Callable], Dict[str, Tuple[WordleSolver, Dict]]]:
+    """
+    Name -> zero-argument callable, and get_best_guess name -> (solver, kept
+    histograms), reset with forget_suggestions before every timed call
+    """
+    benches: Dict[str, Callable] = {'wordbank_load': quiet_word_bank}
+    solvers: Dict[str, Tuple[WordleSolver, Dict]] = {}
+
+    fresh = WordleSolver(word_bank)
+    rng = random.Random(SEED)
+    sample = rng.sample(sorted(word_bank.all_words), 200)
+
+    benches['word_score_x200'] = lambda: [word_bank.get_word_score(w) for w in sample]
+
+    for answer, guesses in FEEDBACK_SCRIPTS:
+        for depth in range(len(guesses) + 1):
+            before = solver_after(word_bank, answer, guesses[:depth])
+            size = len(before.possible_words)
+            tag = f"{answer}_{depth}"
+
+            benches[f"matches_constraints_x200[{tag}]"] = (
+                lambda s=before: [s.matches_constraints(w) for w in sample]
+            )
+            benches[f"get_best_guess[{tag}]"] = before.get_best_guess
+            solvers[f"get_best_guess[{tag}]"] = (before, None)
+            if size <= FULL_RANKING_LIMIT:
+                undone, kept = after_undo(word_bank, answer, guesses[:depth])
+                benches[f"get_best_guess[{tag}:undo]"] = undone.get_best_guess
+                solvers[f"get_best_guess[{tag}:undo]"] = (undone, kept)
+            benches[f"get_possible_words[{tag}]"] = before.get_possible_words
+
+            if depth < len(guesses):
+                after = solver_after(word_bank, answer, guesses[:depth + 1])
+                benches[f"filter_possible_words[{tag}:{size}]"] = (
+                    lambda b=before, a=after: _filter_from(b, a)
+                )
+
+    benches['get_best_guess[fresh]'] = fresh.get_best_guess
+    solvers['get_best_guess[fresh]'] = (fresh, None)
+    return benches, solvers
+
+
+def _filter_from(before: WordleSolver, after: WordleSolver):
+    """Filter before's remaining set with after's constraints"""
+    after.possible_words = before.possible_words
+    after.filter_possible_words()
+
+
+def run(only: str = None, names: List[str] = None) -> Dict[str, float]:
+    """Run benchmarks (all, those matching only, or exactly names), return name -> seconds per call"""
+    word_bank = quiet_word_bank()
+    calibration = time_call(calibration_workload)
+    results = {CALIBRATION: calibration}
+    benches, solvers = collect_benchmarks(word_bank)
+    for name, func in benches.items():
+        if (only and only not in name) or (names is not None and name not in names):
+            continue
+        solver, kept = solvers.get(name, (None, None))
+        setup = (lambda s=solver, k=kept: forget_suggestions(s, k)) if solver is not None else None
+        results[name] = time_relative(func, setup) * calibration
+        line = f"  {name:<48} {results[name] * 1e6:>12.1f} µs"
+        if solver is not None and solver.cache['ranking'] is not None:
+            line += f"  (pruned {solver.last_pruned:,} guesses)"
+        print(line)
+    return results
+
+
+def scaling(backend: str = None):
+    """Time one full ranking per worker count, doubling up to the core count"""
+    word_bank = quiet_word_bank()
+    answer, guesses = FEEDBACK_SCRIPTS[0]
+    pool = random.Random(SEED).sample(sorted(word_bank.all_words), 2000)
+
+    counts = [1]
+    while counts[-1] * 2 <= parallel.cpu_count():
+        counts.append(counts[-1] * 2)
+    if counts[-1] != parallel.cpu_count():
+        counts.append(parallel.cpu_count())
+
+    backend = backend or parallel.default_backend()
+    print(f"  backend: {backend}  (GIL {'disabled' if parallel.GIL_DISABLED else 'enabled'})")
+
+    serial = None
+    for workers in counts:
+        solver = solver_after(word_bank, answer, guesses[:1])
+        solver.workers, solver.backend = workers, backend
+        if workers > 1:
+            parallel.get_executor(backend, workers).submit(int).result()  # start the pool untimed
+
+        start = time.perf_counter()
+        solver.rank_guesses(pool)
+        elapsed = time.perf_counter() - start
+
+        serial = serial or elapsed
+        print(f"  {workers:>3} workers  {elapsed:>8.3f} s  {serial / elapsed:>5.2f}x")
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Names of benchmarks slower than baseline by more than threshold, after calibration"""
+    speed = 1.0
+    if baseline.get(CALIBRATION):
+        speed = results[CALIBRATION] / baseline[CALIBRATION]
+        print(f"  machine speed vs baseline: {1 / speed:.2f}x")
+
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if name == CALIBRATION or not base:
+            continue
+        seconds /= speed
+        if seconds > base * (1 + threshold):
+            regressions.append(name)
+            print(f"⚠ {name}: {base * 1e6:.1f} µs -> {seconds * 1e6:.1f} µs (+{(seconds / base - 1):.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solver micro-benchmarks")
+    parser.add_argument('--save', action='store_true', help="store results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown, e.g. 0.25 = 25%%")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline file")
+    parser.add_argument('--only', help="run benchmarks whose name contains this")
+    parser.add_argument('--scaling', action='store_true', help="show ranking speedup per worker count")
+    parser.add_argument('--backend', choices=('thread', 'process'), help="pool used by --scaling")
+    args = parser.parse_args()
+
+    if args.scaling:
+        print("⏱ Measuring scaling...")
+        scaling(args.backend)
+        return
+
+    print("⏱ Running benchmarks...")
+    results = run(args.only)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.save:
+        baseline.update(results)
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"✅ Saved baseline to {args.baseline}")
+        return
+
+    if not baseline:
+        print("⚠ No baseline yet, run with --save")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for _ in range(RECHECKS):
+        if not regressions:
+            break
+        print(f"↻ Re-checking {len(regressions)} suspected regressions...")
+        regressions = compare(run(names=regressions), baseline, args.threshold)
+
+    if regressions:
+        sys.exit(1)
+    print("✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
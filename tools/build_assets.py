@@ -0,0 +1,126 @@
+"""Static Asset Compiler - Packs word data for the browser app
+
+Usage: python -m tools.build_assets [--out assets]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+from array import array
+from typing import Dict, List
+
+from solver.word_bank import WordBank
+from solver.solver_engine import WordleSolver, get_feedback_pattern
+
+MANIFEST_VERSION = 1
+NO_ENTRY = 0xFFFF
+
+
+def pack_word(word: str) -> int:
+    """Five 5-bit letter codes, position 0 in the low bits"""
+    code = 0
+    for i, letter in enumerate(word):
+        code |= (ord(letter) - ord('a')) << (5 * i)
+    return code
+
+
+def letter_mask(word: str) -> int:
+    """26-bit mask of the letters a word contains"""
+    mask = 0
+    for letter in word:
+        mask |= 1 << (ord(letter) - ord('a'))
+    return mask
+
+
+def build_words(words: List[str]) -> bytes:
+    """uint32 packed codes followed by uint32 letter masks"""
+    data = array('I', [pack_word(w) for w in words])
+    data.extend(letter_mask(w) for w in words)
+    return _little_endian(data)
+
+
+def build_opening_book(solver: WordleSolver, words: List[str]) -> bytes:
+    """
+    uint16 starter index followed by 243 uint16 second-guess indices,
+    one per feedback pattern of the starter (NO_ENTRY if no answer gives it).
+    Each second guess is what the solver itself suggests after that feedback.
+    """
+    index = {w: i for i, w in enumerate(words)}
+    solver.reset()
+    starter, _ = solver.get_best_guess()
+
+    patterns = {get_feedback_pattern(starter, answer) for answer in solver.word_bank.answers}
+
+    book = array('H', [index[starter]] + [NO_ENTRY] * 243)
+    for pattern in sorted(patterns):
+        solver.reset()
+        solver.process_feedback(starter, pattern)
+        random.seed(pattern)  # large buckets sample candidates; keep the book reproducible
+        best, _ = solver.get_best_guess()
+        if best is not None:
+            book[1 + pattern] = index[best]
+
+    return _little_endian(book)
+
+
+def _little_endian(data: array) -> bytes:
+    """Typed arrays in the browser read little-endian"""
+    if array('H', [1]).tobytes()[0] != 1:
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_hashed(out_dir: str, name: str, payload: bytes) -> str:
+    """Write payload as name.<hash>.bin and return the file name"""
+    digest = hashlib.sha256(payload).hexdigest()[:12]
+    filename = f"{name}.{digest}.bin"
+    with open(os.path.join(out_dir, filename), 'wb') as f:
+        f.write(payload)
+    return filename
+
+
+def remove_stale(out_dir: str, files: Dict[str, str]):
+    """Delete hashed assets from earlier builds that the manifest no longer names"""
+    current = set(files.values())
+    for filename in os.listdir(out_dir):
+        if filename.endswith('.bin') and filename.count('.') == 2 and filename not in current:
+            os.remove(os.path.join(out_dir, filename))
+
+
+def build(out_dir: str) -> Dict:
+    """Build all assets and the manifest, return the manifest"""
+    os.makedirs(out_dir, exist_ok=True)
+
+    word_bank = WordBank()
+    solver = WordleSolver(word_bank)
+    words = list(word_bank.sorted_words)
+
+    files = {
+        'words': write_hashed(out_dir, 'words', build_words(words)),
+        'book': write_hashed(out_dir, 'book', build_opening_book(solver, words)),
+    }
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'word_count': len(words),
+        'files': files
+    }
+    with open(os.path.join(out_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    remove_stale(out_dir, files)
+
+    print(f"✅ Wrote {len(files)} assets to {out_dir}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build static assets for the web app")
+    parser.add_argument('--out', default='assets', help="output directory")
+    args = parser.parse_args()
+    build(args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""Starter Word Sweep - Measures every opening word by simulating full games
+
+Usage:
+    python -m tools.starter_sweep init SWEEP_DIR [--chunk-size 20] [--answers-sample N]
+    python -m tools.starter_sweep work SWEEP_DIR [--processes N]
+    python -m tools.starter_sweep status SWEEP_DIR
+    python -m tools.starter_sweep requeue SWEEP_DIR [--older-than 3600]
+    python -m tools.starter_sweep report SWEEP_DIR [--out data/starters.tsv]
+
+SWEEP_DIR is the work queue. Any number of machines sharing it can run
+`work`; chunks are claimed with an atomic rename, and each finished chunk
+is written to done/ so an interrupted sweep resumes where it stopped.
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, Optional
+
+from solver.solver_engine import (
+    FULL_RANKING_LIMIT, SOLVED_PATTERN, STARTERS_FILE, WordleSolver, get_feedback_pattern
+)
+from tools import quiet_word_bank
+
+MAX_TURNS = 10
+
+# A claim is touched when taken, so only chunks claimed longer ago than this
+# are treated as abandoned; keep it well above the time one chunk takes
+REQUEUE_AFTER = 3600
+
+# Positions a worker remembers across openers before starting over (each
+# entry is a set of at most FULL_RANKING_LIMIT words)
+KNOWN_POSITIONS_LIMIT = 200_000
+
+
+def _seed(words):
+    """Seed sampling from the remaining words, so a position always gets the same guess"""
+    random.seed(' '.join(sorted(words)))
+
+
+def play_tree(solver: WordleSolver, starter: str, answers: List[str],
+              known: Optional[Dict[FrozenSet[str], Optional[str]]] = None) -> Dict[str, int]:
+    """
+    Turns the solver needs for each answer after opening with starter.
+    Its choice depends only on the remaining words, so games are played as
+    one decision tree: answers giving the same feedback share every later
+    guess, and each position is filtered and searched once rather than once
+    per answer. known caches the guess for small remaining sets (the ones
+    that need a full ranking) across calls, e.g. for every opener of a chunk.
+    """
+    known = {} if known is None else known
+    turns: Dict[str, int] = {}
+    stack = [([], solver.word_bank.all_words, starter, answers)]
+
+    while stack:
+        history, possible, guess, group = stack.pop()
+        turn = len(history) + 1
+
+        buckets = defaultdict(list)
+        for answer in group:
+            buckets[get_feedback_pattern(guess, answer)].append(answer)
+
+        for pattern, bucket in buckets.items():
+            if pattern == SOLVED_PATTERN:
+                turns[bucket[0]] = turn
+                continue
+            if turn == MAX_TURNS:
+                turns.update(dict.fromkeys(bucket, MAX_TURNS + 1))
+                continue
+
+            solver.restore(history, possible)
+            solver.process_feedback(guess, pattern)
+            remaining = frozenset(solver.possible_words)
+
+            if remaining in known:
+                next_guess = known[remaining]
+            else:
+                _seed(remaining)
+                next_guess, _ = solver.get_best_guess()
+                if len(remaining) <= FULL_RANKING_LIMIT:
+                    known[remaining] = next_guess
+
+            if next_guess is None:
+                turns.update(dict.fromkeys(bucket, MAX_TURNS + 1))
+            else:
+                stack.append((history + [(guess, pattern)], remaining, next_guess, bucket))
+
+    return turns
+
+
+def simulate_game(solver: WordleSolver, starter: str, answer: str) -> int:
+    """Turns the solver needs to find answer after opening with starter"""
+    return play_tree(solver, starter, [answer])[answer]
+
+
+def evaluate_starter(solver: WordleSolver, starter: str, answers: List[str],
+                     known: Optional[Dict] = None) -> Dict:
+    """Turn statistics for one opening word over all answers (known: see play_tree)"""
+    turns = list(play_tree(solver, starter, answers, known).values())
+    return {
+        'games': len(turns),
+        'total': sum(turns),
+        'failed': sum(1 for t in turns if t > 6),
+        'worst': max(turns)
+    }
+
+
+def _paths(sweep_dir: str) -> Dict[str, str]:
+    return {name: os.path.join(sweep_dir, name) for name in ('queue', 'claimed', 'done')}
+
+
+def _write_json(path: str, data):
+    """Atomic write, safe for other machines reading the directory"""
+    tmp = f"{path}.{socket.gethostname()}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def init_sweep(sweep_dir: str, chunk_size: int = 20, answers_sample: Optional[int] = None,
+               candidates: Optional[List[str]] = None):
+    """
+    Split candidate openers into chunk files. Re-running with the same
+    settings queues whatever isn't finished; different settings would mix
+    incompatible results with the kept ones, so they raise ValueError.
+    """
+    paths = _paths(sweep_dir)
+    for path in paths.values():
+        os.makedirs(path, exist_ok=True)
+
+    word_bank = quiet_word_bank()
+    answers = sorted(word_bank.answers)
+    if answers_sample:
+        answers = sorted(random.Random(0).sample(answers, answers_sample))
+    candidates = sorted(candidates or word_bank.all_words)
+
+    config = {'answers': answers, 'chunk_size': chunk_size, 'candidates': candidates}
+    config_file = os.path.join(sweep_dir, 'config.json')
+    if os.path.exists(config_file):
+        with open(config_file) as f:
+            existing = json.load(f)
+        changed = [key for key in config if existing.get(key) != config[key]]
+        if changed:
+            raise ValueError(f"{sweep_dir} was set up with different {', '.join(changed)}; "
+                             f"use a new sweep directory")
+    _write_json(config_file, config)
+
+    claimed = {name.split('.')[0] for name in os.listdir(paths['claimed'])}
+    for n, start in enumerate(range(0, len(candidates), chunk_size)):
+        name = f"{n:05d}.json"
+        if name[:-5] in claimed or os.path.exists(os.path.join(paths['done'], name)):
+            continue  # being worked on or finished
+        _write_json(os.path.join(paths['queue'], name), candidates[start:start + chunk_size])
+
+    print(f"✅ Queued {len(candidates):,} openers against {len(answers):,} answers")
+
+
+def claim_chunk(sweep_dir: str) -> Optional[str]:
+    """Move one queued chunk to claimed/, return its claimed path"""
+    paths = _paths(sweep_dir)
+    owner = f"{socket.gethostname()}-{os.getpid()}"
+
+    for name in sorted(os.listdir(paths['queue'])):
+        if not name.endswith('.json'):
+            continue
+        claimed = os.path.join(paths['claimed'], f"{name[:-5]}.{owner}")
+        try:
+            os.rename(os.path.join(paths['queue'], name), claimed)
+            os.utime(claimed)  # rename keeps the queued mtime; requeue goes by claim time
+        except OSError:
+            continue  # another worker got it first
+        return claimed
+
+    return None
+
+
+def worker_loop(sweep_dir: str) -> int:
+    """Process chunks until the queue is empty, return chunks completed"""
+    paths = _paths(sweep_dir)
+    with open(os.path.join(sweep_dir, 'config.json')) as f:
+        answers = json.load(f)['answers']
+
+    solver = WordleSolver(quiet_word_bank())
+    known = {}
+    completed = 0
+
+    while True:
+        claimed = claim_chunk(sweep_dir)
+        if claimed is None:
+            return completed
+
+        try:
+            with open(claimed) as f:
+                starters = json.load(f)
+        except FileNotFoundError:
+            continue  # requeued before we read it, someone else owns it now
+
+        results = {starter: evaluate_starter(solver, starter, answers, known) for starter in starters}
+        if len(known) > KNOWN_POSITIONS_LIMIT:
+            known.clear()
+
+        name = os.path.basename(claimed).split('.')[0] + '.json'
+        _write_json(os.path.join(paths['done'], name), results)
+        try:
+            os.remove(claimed)
+        except FileNotFoundError:
+            pass  # requeued while we worked; the result is written either way
+        completed += 1
+        print(f"  ✓ chunk {name} ({len(starters)} openers)")
+
+
+def run_workers(sweep_dir: str, processes: Optional[int] = None):
+    """Run a pool of worker processes against the queue"""
+    processes = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        completed = sum(pool.map(worker_loop, [sweep_dir] * processes))
+    print(f"✅ Completed {completed} chunks")
+
+
+def requeue(sweep_dir: str, older_than: float = REQUEUE_AFTER):
+    """Return chunks claimed more than older_than seconds ago (e.g. by crashed workers) to the queue"""
+    paths = _paths(sweep_dir)
+    now = time.time()
+    moved = 0
+
+    for name in os.listdir(paths['claimed']):
+        claimed = os.path.join(paths['claimed'], name)
+        try:
+            if now - os.path.getmtime(claimed) < older_than:
+                continue
+        except FileNotFoundError:
+            continue  # finished meanwhile
+        chunk = name.split('.')[0] + '.json'
+        if os.path.exists(os.path.join(paths['done'], chunk)):
+            try:
+                os.remove(claimed)
+            except FileNotFoundError:
+                pass
+            continue
+        try:
+            os.rename(claimed, os.path.join(paths['queue'], chunk))
+            moved += 1
+        except OSError:
+            pass
+
+    print(f"↻ Requeued {moved} chunks")
+
+
+def status(sweep_dir: str) -> Dict[str, int]:
+    """Chunk counts per state"""
+    counts = {state: len(os.listdir(path)) for state, path in _paths(sweep_dir).items()}
+    print("  ".join(f"{state}: {n}" for state, n in counts.items()))
+    return counts
+
+
+def collect_results(sweep_dir: str) -> Dict[str, Dict]:
+    """Merge all finished chunks"""
+    done = _paths(sweep_dir)['done']
+    results = {}
+    for name in sorted(os.listdir(done)):
+        if name.endswith('.json'):
+            with open(os.path.join(done, name)) as f:
+                results.update(json.load(f))
+    return results
+
+
+def write_report(sweep_dir: str, out: str = STARTERS_FILE):
+    """Write the ranked starter table the solver loads"""
+    results = collect_results(sweep_dir)
+    ranked = sorted(results.items(), key=lambda r: (r[1]['failed'], r[1]['total'] / r[1]['games'], r[0]))
+
+    with open(out, 'w') as f:
+        f.write("# word\tavg_turns\tfailed\tworst\tgames\n")
+        for word, r in ranked:
+            f.write(f"{word}\t{r['total'] / r['games']:.4f}\t{r['failed']}\t{r['worst']}\t{r['games']}\n")
+
+    print(f"✅ Ranked {len(ranked):,} openers into {out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure opening words by full-game simulation")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('init', help="create the work queue")
+    p.add_argument('sweep_dir')
+    p.add_argument('--chunk-size', type=int, default=20)
+    p.add_argument('--answers-sample', type=int, help="simulate against a fixed sample of answers")
+    p.add_argument('--candidates', help="file with one opening word per line (default: all words)")
+
+    p = commands.add_parser('work', help="process chunks until the queue is empty")
+    p.add_argument('sweep_dir')
+    p.add_argument('--processes', type=int)
+
+    p = commands.add_parser('status', help="show queue progress")
+    p.add_argument('sweep_dir')
+
+    p = commands.add_parser('requeue', help="return abandoned chunks to the queue")
+    p.add_argument('sweep_dir')
+    p.add_argument('--older-than', type=float, default=REQUEUE_AFTER,
+                   help="only chunks claimed at least this many seconds ago")
+
+    p = commands.add_parser('report', help="write the ranked starter table")
+    p.add_argument('sweep_dir')
+    p.add_argument('--out', default=STARTERS_FILE)
+
+    args = parser.parse_args()
+
+    if args.command == 'init':
+        candidates = None
+        if args.candidates:
+            with open(args.candidates) as f:
+                candidates = [w.strip().lower() for w in f if len(w.strip()) == 5]
+        try:
+            init_sweep(args.sweep_dir, args.chunk_size, args.answers_sample, candidates)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == 'work':
+        run_workers(args.sweep_dir, args.processes)
+    elif args.command == 'status':
+        status(args.sweep_dir)
+    elif args.command == 'requeue':
+        requeue(args.sweep_dir, args.older_than)
+    elif args.command == 'report':
+        write_report(args.sweep_dir, args.out)
+
+
+if __name__ == "__main__":
+    main()